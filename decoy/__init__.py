@@ -207,6 +207,8 @@ class Stub(Generic[ReturnT]):
     See [stubbing usage guide](usage/when.md) for more details.
     """
 
+    __slots__ = ("_core",)
+
     def __init__(self, core: StubCore) -> None:
         self._core = core
 
@@ -308,6 +310,8 @@ class Prop(Generic[ReturnT]):
     See [property mocking guide](advanced/properties.md) for more details.
     """
 
+    __slots__ = ("_core",)
+
     def __init__(self, core: PropCore) -> None:
         self._core = core
 
@@ -5,7 +5,14 @@ from typing import Any, Callable, Optional
 from .call_handler import CallHandler
 from .errors import MockNotAsyncError
 from .spy import SpyCreator
-from .spy_events import WhenRehearsal, PropAccessType, SpyEvent, SpyInfo, SpyPropAccess
+from .spy_events import (
+    WhenRehearsal,
+    PropAccessType,
+    SpyEvent,
+    SpyInfo,
+    SpyPropAccess,
+    get_prop_access,
+)
 from .spy_log import SpyLog
 from .stub_store import StubBehavior, StubStore
 from .types import ContextValueT, ReturnT
@@ -80,7 +87,11 @@ class DecoyCore:
     def reset(self) -> None:
         """Reset and remove all stored spies and stubs."""
         calls = self._spy_log.get_all()
-        self._warning_checker.check(calls)
+
+        # tests that never touched a spy have nothing to warn about
+        if len(calls) > 0:
+            self._warning_checker.check(calls)
+
         self._spy_log.clear()
         self._stub_store.clear()
 
@@ -88,6 +99,8 @@ class DecoyCore:
 class StubCore:
     """The StubCore class implements the main logic of a Decoy Stub."""
 
+    __slots__ = ("_rehearsal", "_stub_store")
+
     def __init__(self, rehearsal: WhenRehearsal, stub_store: StubStore) -> None:
         """Initialize the Stub with a configuration."""
         self._rehearsal = rehearsal
@@ -95,12 +108,16 @@ class StubCore:
 
     def then_return(self, *values: ReturnT) -> None:
         """Set the stub to return value(s)."""
-        for i, return_value in reversed(list(enumerate(values))):
-            self._stub_store.add(
-                rehearsal=self._rehearsal,
+        add_stub = self._stub_store.add
+        rehearsal = self._rehearsal
+        last_index = len(values) - 1
+
+        for i in range(last_index, -1, -1):
+            add_stub(
+                rehearsal=rehearsal,
                 behavior=StubBehavior(
-                    return_value=return_value,
-                    once=(i != len(values) - 1),
+                    return_value=values[i],
+                    once=(i != last_index),
                 ),
             )
 
@@ -137,6 +154,8 @@ class StubCore:
 class PropCore:
     """Main logic of a property access rehearser."""
 
+    __slots__ = ("_spy", "_prop_name", "_spy_log")
+
     def __init__(
         self,
         spy: SpyInfo,
@@ -163,9 +182,6 @@ class PropCore:
         """Create a property deleter rehearsal."""
         event = SpyEvent(
             spy=self._spy,
-            payload=SpyPropAccess(
-                prop_name=self._prop_name,
-                access_type=PropAccessType.DELETE,
-            ),
+            payload=get_prop_access(self._prop_name, PropAccessType.DELETE),
         )
         self._spy_log.push(event)
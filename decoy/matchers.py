@@ -26,6 +26,7 @@ See the [matchers guide][] for more details.
     Identity comparisons (`is`) will not work with matchers. Decoy only uses
     equality comparisons (`==`) for stubbing and verification.
 """
+from functools import lru_cache
 from re import compile as compile_re
 from typing import cast, Any, List, Mapping, Optional, Pattern, Type, TypeVar
 
@@ -65,6 +66,7 @@ def Anything() -> Any:
 class _IsA:
     _match_type: type
     _attributes: Optional[Mapping[str, Any]]
+    _attributes_matcher: Optional["_HasAttributes"]
 
     def __init__(
         self,
@@ -74,13 +76,16 @@ class _IsA:
         """Initialize the matcher with a type and optional attributes."""
         self._match_type = match_type
         self._attributes = attributes
+        self._attributes_matcher = _HasAttributes(attributes) if attributes else None
 
     def __eq__(self, target: object) -> bool:
         """Return true if target is the correct type and matches attributes."""
         matches_type = isinstance(target, self._match_type)
-        matches_attrs = (
-            target == HasAttributes(self._attributes) if self._attributes else True
-        )
+
+        if self._attributes_matcher is None:
+            return matches_type
+
+        matches_attrs = target == self._attributes_matcher
 
         return matches_type and matches_attrs
 
@@ -148,6 +153,9 @@ def IsNot(value: object) -> Any:
     return _IsNot(value)
 
 
+_MISSING_ATTRIBUTE = object()
+
+
 class _HasAttributes:
     _attributes: Mapping[str, Any]
 
@@ -156,14 +164,14 @@ class _HasAttributes:
 
     def __eq__(self, target: object) -> bool:
         """Return true if target matches all given attributes."""
-        is_match = True
         for attr_name, value in self._attributes.items():
-            if is_match:
-                is_match = (
-                    hasattr(target, attr_name) and getattr(target, attr_name) == value
-                )
+            attr_value = getattr(target, attr_name, _MISSING_ATTRIBUTE)
+            is_match = attr_value is not _MISSING_ATTRIBUTE and attr_value == value
 
-        return is_match
+            if not is_match:
+                return False
+
+        return True
 
     def __repr__(self) -> str:
         """Return a string representation of the matcher."""
@@ -197,16 +205,16 @@ class _DictMatching:
 
     def __eq__(self, target: object) -> bool:
         """Return true if target matches all given keys/values."""
-        is_match = True
+        try:
+            for key, value in self._values.items():
+                is_match = key in target and target[key] == value  # type: ignore[index,operator]
 
-        for key, value in self._values.items():
-            if is_match:
-                try:
-                    is_match = key in target and target[key] == value  # type: ignore[index,operator]
-                except TypeError:
-                    is_match = False
+                if not is_match:
+                    return False
+        except TypeError:
+            return False
 
-        return is_match
+        return True
 
     def __repr__(self) -> str:
         """Return a string representation of the matcher."""
@@ -228,12 +236,18 @@ def DictMatching(values: Mapping[str, Any]) -> Any:
     return _DictMatching(values)
 
 
+@lru_cache(maxsize=256)
+def _compile_pattern(match: str) -> Pattern[str]:
+    """Compile a pattern, sharing compiled patterns between matchers."""
+    return compile_re(match)
+
+
 class _StringMatching:
     _pattern: Pattern[str]
 
     def __init__(self, match: str) -> None:
         """Initialize the matcher with the pattern to match."""
-        self._pattern = compile_re(match)
+        self._pattern = _compile_pattern(match)
 
     def __eq__(self, target: object) -> bool:
         """Return true if target is not self._reject_value."""
@@ -270,14 +284,11 @@ class _ErrorMatching:
 
     def __eq__(self, target: object) -> bool:
         """Return true if target is not self._reject_value."""
-        error_match = type(target) == self._error_type
-        message_match = (
-            str(target) == self._string_matcher
-            if self._string_matcher is not None
-            else True
-        )
+        # only stringify the target once it is known to be the right error
+        if type(target) is not self._error_type:
+            return False
 
-        return error_match and message_match
+        return self._string_matcher is None or str(target) == self._string_matcher
 
     def __repr__(self) -> str:
         """Return a string representation of the matcher."""
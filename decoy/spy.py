@@ -9,7 +9,16 @@ from typing import Any, ContextManager, Dict, Optional, Type, Union, cast, overl
 
 from .call_handler import CallHandler
 from .spy_core import SpyCore
-from .spy_events import SpyCall, SpyEvent, SpyPropAccess, PropAccessType
+from .spy_events import (
+    SpyCall,
+    SpyEvent,
+    SpyPropAccess,
+    PropAccessType,
+    get_prop_access,
+)
+
+
+_NOT_SET = object()
 
 
 class BaseSpy(ContextManager[Any]):
@@ -33,7 +42,10 @@ class BaseSpy(ContextManager[Any]):
     ) -> None:
         """Initialize a BaseSpy from a call handler and an optional spec object."""
         super().__setattr__("_decoy_spy_core", core)
-        super().__setattr__("_decoy_spy_call_handler", call_handler)
+        super().__setattr__("_decoy_spy_class", core.class_type or type(self))
+        # bind hot lookups once so each interaction skips the attribute chain
+        super().__setattr__("_decoy_spy_info", core.info)
+        super().__setattr__("_decoy_spy_handle", call_handler.handle)
         super().__setattr__("_decoy_spy_creator", spy_creator)
         super().__setattr__("_decoy_spy_children", {})
         super().__setattr__("_decoy_spy_property_values", {})
@@ -42,7 +54,7 @@ class BaseSpy(ContextManager[Any]):
     @property  # type: ignore[misc]
     def __class__(self) -> Any:
         """Ensure Spy can pass `instanceof` checks."""
-        return self._decoy_spy_core.class_type or type(self)
+        return self._decoy_spy_class
 
     def __enter__(self) -> Any:
         """Allow a spy to be used as a context manager."""
@@ -85,7 +97,7 @@ class BaseSpy(ContextManager[Any]):
     def __getattr__(self, name: str) -> Any:
         """Get a property of the spy, always returning a child spy."""
         # do not attempt to mock magic methods
-        if name.startswith("__") and name.endswith("__"):
+        if name[:2] == "__" == name[-2:]:
             return super().__getattribute__(name)
 
         return self._decoy_spy_get_or_create_child_spy(name)
@@ -93,23 +105,23 @@ class BaseSpy(ContextManager[Any]):
     def __setattr__(self, name: str, value: Any) -> None:
         """Set a property on the spy, recording the call."""
         event = SpyEvent(
-            spy=self._decoy_spy_core.info,
+            spy=self._decoy_spy_info,
             payload=SpyPropAccess(
                 prop_name=name,
                 access_type=PropAccessType.SET,
                 value=value,
             ),
         )
-        self._decoy_spy_call_handler.handle(event)
+        self._decoy_spy_handle(event)
         self._decoy_spy_property_values[name] = value
 
     def __delattr__(self, name: str) -> None:
         """Delete a property on the spy, recording the call."""
         event = SpyEvent(
-            spy=self._decoy_spy_core.info,
-            payload=SpyPropAccess(prop_name=name, access_type=PropAccessType.DELETE),
+            spy=self._decoy_spy_info,
+            payload=get_prop_access(name, PropAccessType.DELETE),
         )
-        self._decoy_spy_call_handler.handle(event)
+        self._decoy_spy_handle(event)
         self._decoy_spy_property_values.pop(name, None)
 
     def _decoy_spy_get_or_create_child_spy(
@@ -117,25 +129,26 @@ class BaseSpy(ContextManager[Any]):
     ) -> Any:
         """Lazily construct a child spy, basing it on type hints if available."""
         # check for any stubbed behaviors for property getter
-        get_result = self._decoy_spy_call_handler.handle(
+        get_result = self._decoy_spy_handle(
             SpyEvent(
-                spy=self._decoy_spy_core.info,
-                payload=SpyPropAccess(
-                    prop_name=name,
-                    access_type=PropAccessType.GET,
-                ),
+                spy=self._decoy_spy_info,
+                payload=get_prop_access(name, PropAccessType.GET),
             )
         )
 
         if get_result:
             return get_result.value
 
-        if name in self._decoy_spy_property_values:
-            return self._decoy_spy_property_values[name]
+        property_value = self._decoy_spy_property_values.get(name, _NOT_SET)
+
+        if property_value is not _NOT_SET:
+            return property_value
 
         # return previously constructed (and cached) child spies
-        if name in self._decoy_spy_children:
-            return self._decoy_spy_children[name]
+        child_spy = self._decoy_spy_children.get(name)
+
+        if child_spy is not None:
+            return child_spy
 
         child_core = self._decoy_spy_core.create_child_core(
             name=name, is_async=child_is_async
@@ -148,14 +161,14 @@ class BaseSpy(ContextManager[Any]):
     def _decoy_spy_call(self, *args: Any, **kwargs: Any) -> Any:
         bound_args, bound_kwargs = self._decoy_spy_core.bind_args(*args, **kwargs)
         call = SpyEvent(
-            spy=self._decoy_spy_core.info,
+            spy=self._decoy_spy_info,
             payload=SpyCall(
                 args=bound_args,
                 kwargs=bound_kwargs,
             ),
         )
 
-        result = self._decoy_spy_call_handler.handle(call)
+        result = self._decoy_spy_handle(call)
         return result.value if result else None
 
 
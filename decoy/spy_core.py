@@ -2,7 +2,20 @@
 import inspect
 import functools
 import warnings
-from typing import Any, Dict, NamedTuple, Optional, Tuple, Type, Union, get_type_hints
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_type_hints,
+)
+from weakref import WeakKeyDictionary
 
 from .spy_events import SpyInfo
 from .warnings import IncorrectCallWarning, MissingSpecAttributeWarning
@@ -23,8 +36,26 @@ class BoundArgs(NamedTuple):
     kwargs: Dict[str, Any]
 
 
+class _PositionalArity(NamedTuple):
+    """Range of positional-only call lengths that bind to a signature as-is."""
+
+    minimum: int
+    maximum: Optional[int]
+
+
+class _KeywordParameters(NamedTuple):
+    """Names of a signature whose parameters are all positional-or-keyword."""
+
+    names: Tuple[str, ...]
+    required: FrozenSet[str]
+
+
 _DEFAULT_SPY_NAME = "unnamed"
 
+_SourceValueT = TypeVar("_SourceValueT")
+
+_NOT_FOUND = object()
+
 
 class SpyCore:
     """Core spy logic for mimicking a given `source` object.
@@ -58,8 +89,12 @@ class SpyCore:
             f"{self._module_name}.{self._name}" if self._module_name else self._name
         )
         self._class_type = self._source if inspect.isclass(self._source) else None
-        self._signature = _get_signature(source)
-        self._is_async = is_async or _get_is_async(source)
+        callable_source = _get_callable_source(source)
+
+        self._signature = _get_signature(callable_source)
+        self._positional_arity = _get_positional_arity(self._signature)
+        self._keyword_parameters = _get_keyword_parameters(self._signature)
+        self._is_async = is_async or _get_is_async(callable_source)
         self._info = SpyInfo(id=id(self), name=self._name, is_async=self._is_async)
 
     @property
@@ -94,6 +129,23 @@ class SpyCore:
         through without modification.
         """
         signature = self._signature
+        arity = self._positional_arity
+
+        # a call with only positional arguments, within the signature's
+        # positional arity, binds to exactly the arguments it was given
+        if (
+            arity is not None
+            and not kwargs
+            and arity.minimum <= len(args)
+            and (arity.maximum is None or len(args) <= arity.maximum)
+        ):
+            return BoundArgs(args=args, kwargs=kwargs)
+
+        if self._keyword_parameters is not None and kwargs:
+            bound = _bind_keywords(self._keyword_parameters, args, kwargs)
+
+            if bound is not None:
+                return bound
 
         if signature:
             try:
@@ -117,7 +169,7 @@ class SpyCore:
             # use type hints to get child spec for class attributes
             child_hint = _get_type_hints(source).get(name)
             # use inspect to get child spec for methods and properties
-            child_source = inspect.getattr_static(source, name, child_hint)
+            child_source = _getattr_static(source, name, child_hint)
 
             if isinstance(child_source, property):
                 child_source = _get_type_hints(child_source.fget).get("return")
@@ -153,6 +205,9 @@ class SpyCore:
 
 def _resolve_source(source: Any) -> Any:
     """Resolve the source object, unwrapping any generic aliases."""
+    if source is None:
+        return None
+
     origin = inspect.getattr_static(source, "__origin__", None)
 
     return origin if origin is not None else source
@@ -170,20 +225,171 @@ def _get_module_name(source: Any) -> Optional[str]:
     return module_name if isinstance(module_name, str) else None
 
 
+def _memoize_by_source(
+    get_value: Callable[[Any], _SourceValueT],
+) -> Callable[[Any], _SourceValueT]:
+    """Memoize a source inspection function, keyed weakly by the source object.
+
+    The same classes and functions are used as specs over and over in a test
+    suite, and inspecting them is expensive. Sources that cannot be weakly
+    referenced or hashed are inspected every time.
+    """
+    cache: "WeakKeyDictionary[Any, _SourceValueT]" = WeakKeyDictionary()
+
+    @functools.wraps(get_value)
+    def _get_memoized_value(source: Any) -> _SourceValueT:
+        try:
+            return cache[source]
+        except KeyError:
+            value = cache[source] = get_value(source)
+            return value
+        except TypeError:
+            return get_value(source)
+
+    return _get_memoized_value
+
+
 def _get_signature(source: Any) -> Optional[inspect.Signature]:
-    """Get the signature of a source object."""
-    source = _get_callable_source(source)
+    """Get the signature of a callable source object."""
+    # methods are wrapped in a new `partial` for every child spy,
+    # so key their signatures by the underlying function instead
+    if (
+        isinstance(source, functools.partial)
+        and len(source.args) == 1
+        and source.args[0] is None
+        and not source.keywords
+    ):
+        return _get_method_signature(source.func)
+
+    return _get_source_signature(source)
+
+
+@_memoize_by_source
+def _get_source_signature(source: Any) -> Optional[inspect.Signature]:
+    """Get the signature of a callable source object."""
+    return _inspect_signature(source)
+
+
+@_memoize_by_source
+def _get_method_signature(method: Any) -> Optional[inspect.Signature]:
+    """Get the signature of a method, with its `self` argument consumed."""
+    return _inspect_signature(functools.partial(method, None))
+
 
+def _inspect_signature(source: Any) -> Optional[inspect.Signature]:
     try:
         return inspect.signature(source, follow_wrapped=True)
     except (ValueError, TypeError):
         return None
 
 
-def _get_is_async(source: Any) -> bool:
-    """Get whether the source is an asynchronous callable."""
-    source = _get_callable_source(source)
+def _get_positional_arity(
+    signature: Optional[inspect.Signature],
+) -> Optional[_PositionalArity]:
+    """Get the positional arity of a signature, if positional calls can bind as-is.
+
+    Returns `None` if there is no signature, or if a call without keyword
+    arguments can never bind because of a required keyword-only parameter.
+    """
+    if signature is None:
+        return None
+
+    minimum = 0
+    maximum: Optional[int] = 0
+
+    for parameter in signature.parameters.values():
+        if parameter.kind in (
+            inspect.Parameter.POSITIONAL_ONLY,
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        ):
+            if parameter.default is inspect.Parameter.empty:
+                minimum = minimum + 1
+            if maximum is not None:
+                maximum = maximum + 1
+
+        elif parameter.kind == inspect.Parameter.VAR_POSITIONAL:
+            maximum = None
+
+        elif (
+            parameter.kind == inspect.Parameter.KEYWORD_ONLY
+            and parameter.default is inspect.Parameter.empty
+        ):
+            return None
 
+    return _PositionalArity(minimum=minimum, maximum=maximum)
+
+
+def _get_keyword_parameters(
+    signature: Optional[inspect.Signature],
+) -> Optional[_KeywordParameters]:
+    """Get a signature's parameter names, if every one is positional-or-keyword.
+
+    Returns `None` for any other signature, which must be bound by `inspect`.
+    """
+    if signature is None:
+        return None
+
+    names = []
+    required = []
+
+    for parameter in signature.parameters.values():
+        if parameter.kind != inspect.Parameter.POSITIONAL_OR_KEYWORD:
+            return None
+
+        names.append(parameter.name)
+
+        if parameter.default is inspect.Parameter.empty:
+            required.append(parameter.name)
+
+    return _KeywordParameters(names=tuple(names), required=frozenset(required))
+
+
+def _bind_keywords(
+    parameters: _KeywordParameters,
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any],
+) -> Optional[BoundArgs]:
+    """Bind a call to positional-or-keyword parameters like `Signature.bind`.
+
+    Returns `None` if the call does not bind cleanly, so the caller can
+    fall back to `Signature.bind` and its error message.
+    """
+    names = parameters.names
+
+    if len(args) > len(names):
+        return None
+
+    bound_args = list(args)
+    bound_kwargs: Dict[str, Any] = {}
+    is_skipped = False
+    used_count = 0
+
+    # like `BoundArguments`, values stay positional until the first skipped
+    # parameter, and any values after that one are passed by keyword
+    for name in names[len(args) :]:
+        if name in kwargs:
+            used_count = used_count + 1
+
+            if is_skipped:
+                bound_kwargs[name] = kwargs[name]
+            else:
+                bound_args.append(kwargs[name])
+
+        elif name in parameters.required:
+            return None
+
+        else:
+            is_skipped = True
+
+    # unknown keywords, or keywords also passed positionally, do not bind
+    if used_count != len(kwargs):
+        return None
+
+    return BoundArgs(args=tuple(bound_args), kwargs=bound_kwargs)
+
+
+def _get_is_async(source: Any) -> bool:
+    """Get whether the callable source is an asynchronous callable."""
     # `iscoroutinefunction` does not work for `partial` on Python < 3.8
     if isinstance(source, functools.partial):
         source = source.func
@@ -195,7 +401,7 @@ def _get_callable_source(source: Any) -> Any:
     """Return the source's callable, checking if a class has a __call__ method."""
     # check if spec source is a class with a __call__ method
     if inspect.isclass(source):
-        call_method = inspect.getattr_static(source, "__call__", None)
+        call_method = _getattr_static(source, "__call__", None)
         if inspect.isfunction(call_method):
             # consume the `self` argument of the method to ensure proper
             # signature reporting by wrapping it in a partial
@@ -204,6 +410,25 @@ def _get_callable_source(source: Any) -> Any:
     return source
 
 
+def _getattr_static(source: Any, name: str, default: Any) -> Any:
+    """Get an attribute without triggering descriptors, like `getattr_static`.
+
+    `inspect.getattr_static` guards every lookup against metaclasses that
+    shadow `__dict__`. Classes whose metaclass is exactly `type` cannot do
+    that, so their MRO can be searched directly, falling back to the full
+    lookup for anything not found there.
+    """
+    if type(source) is type:
+        for base in source.__mro__:
+            value = base.__dict__.get(name, _NOT_FOUND)
+
+            if value is not _NOT_FOUND:
+                return value
+
+    return inspect.getattr_static(source, name, default)
+
+
+@_memoize_by_source
 def _get_type_hints(obj: Any) -> Dict[str, Any]:
     """Get type hints for an object, if possible.
 
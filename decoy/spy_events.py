@@ -1,14 +1,15 @@
 """Spy interaction event value objects."""
 import enum
+from functools import lru_cache
 from typing import Any, Dict, NamedTuple, Optional, Tuple, Union
 
 
-class PropAccessType(str, enum.Enum):
+class PropAccessType(enum.IntEnum):
     """Property access type."""
 
-    GET = "get"
-    SET = "set"
-    DELETE = "delete"
+    GET = 0
+    SET = 1
+    DELETE = 2
 
 
 class SpyInfo(NamedTuple):
@@ -35,6 +36,18 @@ class SpyPropAccess(NamedTuple):
     value: Optional[Any] = None
 
 
+@lru_cache(maxsize=256)
+def get_prop_access(prop_name: str, access_type: PropAccessType) -> SpyPropAccess:
+    """Get a shared payload for a value-less get or delete of a property.
+
+    Gets and deletes carry no per-access state, and the same few names
+    (e.g. `__enter__` and `__exit__` for context managers) are accessed over
+    and over, so payloads are interned rather than re-created each time.
+    Sets carry a value and should construct a `SpyPropAccess` directly.
+    """
+    return SpyPropAccess(prop_name=prop_name, access_type=access_type)
+
+
 class SpyEvent(NamedTuple):
     """An interaction with a spy by the code under test."""
 
@@ -70,29 +83,44 @@ AnySpyEvent = Union[SpyEvent, SpyRehearsal]
 
 def match_event(event: AnySpyEvent, rehearsal: SpyRehearsal) -> bool:
     """Check if a call matches a given rehearsal."""
-    if event.spy != rehearsal.spy:
+    # events and rehearsals from the same spy share one SpyInfo instance
+    if event.spy is not rehearsal.spy and event.spy != rehearsal.spy:
         return False
 
-    if (
-        isinstance(event.payload, SpyCall)
-        and isinstance(rehearsal.payload, SpyCall)
-        and rehearsal.payload.ignore_extra_args
-    ):
-        call = event.payload
-        rehearsed_call = rehearsal.payload
-
-        try:
-            args_match = all(
-                value == call.args[i] for i, value in enumerate(rehearsed_call.args)
-            )
-            kwargs_match = all(
-                value == call.kwargs[key]
-                for key, value in rehearsed_call.kwargs.items()
-            )
-
-            return args_match and kwargs_match
-
-        except (IndexError, KeyError):
+    payload = event.payload
+    rehearsed_payload = rehearsal.payload
+
+    # the rehearsal alone decides which comparison applies, so the common
+    # exact-match path costs a single type check before the equality test
+    if type(rehearsed_payload) is SpyCall and rehearsed_payload.ignore_extra_args:
+        return type(payload) is SpyCall and _match_call_ignoring_extra_args(
+            payload, rehearsed_payload
+        )
+
+    return rehearsed_payload == payload
+
+
+def _match_call_ignoring_extra_args(call: SpyCall, rehearsed_call: SpyCall) -> bool:
+    """Check if a call matches a rehearsal, ignoring unrehearsed arguments."""
+    # positional and keyword arguments are checked independently, so a
+    # mismatch in one does not hide the other from matchers like Captor
+    args_match = True
+    kwargs_match = True
+
+    for i, value in enumerate(rehearsed_call.args):
+        if i >= len(call.args):
+            return False
+
+        if not value == call.args[i]:
+            args_match = False
+            break
+
+    for key, value in rehearsed_call.kwargs.items():
+        if key not in call.kwargs:
             return False
 
-    return rehearsal.payload == event.payload
+        if not value == call.kwargs[key]:
+            kwargs_match = False
+            break
+
+    return args_match and kwargs_match
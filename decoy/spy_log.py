@@ -1,5 +1,5 @@
 """Spy activity log."""
-from typing import List, Sequence
+from typing import Dict, List, Sequence, Union
 
 from .errors import MissingRehearsalError
 from .spy_events import (
@@ -19,9 +19,13 @@ class SpyLog:
 
     def __init__(self) -> None:
         self._log: List[AnySpyEvent] = []
+        # log positions of each spy's events, so lookups by spy
+        # only visit that spy's entries rather than the whole log
+        self._indices_by_spy_id: Dict[int, List[int]] = {}
 
     def push(self, spy_call: AnySpyEvent) -> None:
         """Add a new spy call to the stack."""
+        self._indices_by_spy_id.setdefault(spy_call.spy.id, []).append(len(self._log))
         self._log.append(spy_call)
 
     def consume_when_rehearsal(self, ignore_extra_args: bool) -> WhenRehearsal:
@@ -37,9 +41,10 @@ class SpyLog:
         if not isinstance(event, SpyEvent):
             raise MissingRehearsalError()
 
-        spy, payload = _apply_ignore_extra_args(event, ignore_extra_args)
-
-        rehearsal = WhenRehearsal(spy=spy, payload=payload)
+        rehearsal = WhenRehearsal(
+            spy=event.spy,
+            payload=_apply_ignore_extra_args(event.payload, ignore_extra_args),
+        )
         self._log[-1] = rehearsal
         return rehearsal
 
@@ -67,14 +72,16 @@ class SpyLog:
 
             if _is_verifiable(event):
                 rehearsal = VerifyRehearsal(
-                    *_apply_ignore_extra_args(event, ignore_extra_args)
+                    spy=event.spy,
+                    payload=_apply_ignore_extra_args(event.payload, ignore_extra_args),
                 )
                 rehearsals.append(rehearsal)
                 self._log[index] = rehearsal
 
             index = index - 1
 
-        return list(reversed(rehearsals))
+        rehearsals.reverse()
+        return rehearsals
 
     def consume_prop_rehearsal(self) -> PropRehearsal:
         """Consume the last property get as a rehearsal."""
@@ -98,12 +105,24 @@ class SpyLog:
 
     def get_calls_to_verify(self, spy_ids: Sequence[int]) -> List[SpyEvent]:
         """Get all non-rehearsal calls to the spies in the given rehearsals."""
+        log = self._log
+        indices_by_spy_id = self._indices_by_spy_id
+        spy_id_set = set(spy_ids)
+
+        # a single spy's positions are already in log order
+        if len(spy_id_set) == 1:
+            indices: Sequence[int] = indices_by_spy_id.get(spy_id_set.pop(), ())
+        else:
+            indices = sorted(
+                index
+                for spy_id in spy_id_set
+                for index in indices_by_spy_id.get(spy_id, ())
+            )
+
         return [
             event
-            for event in self._log
-            if event.spy.id in spy_ids
-            and isinstance(event, SpyEvent)
-            and _is_verifiable(event)
+            for event in (log[index] for index in indices)
+            if isinstance(event, SpyEvent) and _is_verifiable(event)
         ]
 
     def get_all(self) -> List[AnySpyEvent]:
@@ -113,6 +132,7 @@ class SpyLog:
     def clear(self) -> None:
         """Remove all stored calls."""
         self._log.clear()
+        self._indices_by_spy_id.clear()
 
 
 def _is_verifiable(event: AnySpyEvent) -> bool:
@@ -122,10 +142,12 @@ def _is_verifiable(event: AnySpyEvent) -> bool:
     )
 
 
-def _apply_ignore_extra_args(event: AnySpyEvent, ignore_extra_args: bool) -> SpyEvent:
-    spy, payload = event
-
-    if isinstance(payload, SpyCall):
-        payload = payload._replace(ignore_extra_args=ignore_extra_args)
+def _apply_ignore_extra_args(
+    payload: Union[SpyCall, SpyPropAccess],
+    ignore_extra_args: bool,
+) -> Union[SpyCall, SpyPropAccess]:
+    # only copy the payload if the option actually changes it
+    if isinstance(payload, SpyCall) and payload.ignore_extra_args != ignore_extra_args:
+        return payload._replace(ignore_extra_args=ignore_extra_args)
 
-    return SpyEvent(spy=spy, payload=payload)
+    return payload
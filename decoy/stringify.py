@@ -30,11 +30,11 @@ def stringify_call(event: AnySpyEvent) -> str:
 
     else:
         args_list = [repr(arg) for arg in payload.args]
-        kwargs_list = [f"{key}={val!r}" for key, val in payload.kwargs.items()]
+        args_list.extend(f"{key}={val!r}" for key, val in payload.kwargs.items())
         extra_args_msg = (
             " - ignoring unspecified arguments" if payload.ignore_extra_args else ""
         )
-        return f"{spy.name}({', '.join(args_list + kwargs_list)}){extra_args_msg}"
+        return f"{spy.name}({', '.join(args_list)}){extra_args_msg}"
 
 
 def stringify_call_list(calls: Sequence[AnySpyEvent]) -> str:
@@ -1,11 +1,14 @@
 """Stub creation and storage."""
-from typing import Any, Callable, List, NamedTuple, Optional, Union
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Union
 
 from .spy_events import SpyEvent, WhenRehearsal, match_event
 
 
 class _MISSING:
-    pass
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "MISSING"
 
 
 MISSING = _MISSING()
@@ -13,6 +16,7 @@ MISSING = _MISSING()
 
 Used when `None` could be a valid value,
 so `Optional` would be inappropriate.
+Compare against it with `is`, never `==`.
 """
 
 
@@ -38,7 +42,8 @@ class StubStore:
 
     def __init__(self) -> None:
         """Initialize a StubStore with an empty stubbings list."""
-        self._stubs: List[StubEntry] = []
+        # stubs are bucketed by spy ID, so a lookup only scans its own spy's stubs
+        self._stubs_by_spy_id: Dict[int, List[StubEntry]] = {}
 
     def add(
         self,
@@ -46,18 +51,22 @@ class StubStore:
         behavior: StubBehavior,
     ) -> None:
         """Create and add a new StubBehavior to the store."""
-        self._stubs.append(StubEntry(rehearsal=rehearsal, behavior=behavior))
+        stub = StubEntry(rehearsal=rehearsal, behavior=behavior)
+        self._stubs_by_spy_id.setdefault(rehearsal.spy.id, []).append(stub)
 
     def get_by_call(self, call: SpyEvent) -> Optional[StubBehavior]:
         """Get the latest StubBehavior matching this call."""
-        reversed_indices = range(len(self._stubs) - 1, -1, -1)
+        stubs = self._stubs_by_spy_id.get(call.spy.id)
+
+        if not stubs:
+            return None
 
-        for i in reversed_indices:
-            stub = self._stubs[i]
+        for i in range(len(stubs) - 1, -1, -1):
+            stub = stubs[i]
 
             if match_event(call, stub.rehearsal):
                 if stub.behavior.once:
-                    self._stubs.pop(i)
+                    stubs.pop(i)
 
                 return stub.behavior
 
@@ -65,4 +74,4 @@ class StubStore:
 
     def clear(self) -> None:
         """Remove all stored Stubs."""
-        self._stubs.clear()
+        self._stubs_by_spy_id.clear()
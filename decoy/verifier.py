@@ -31,11 +31,16 @@ class Verifier:
         """
         match_count = 0
 
-        for i in range(len(calls)):
-            calls_subset = calls[i : i + len(rehearsals)]
-            matches = [match_event(c, r) for c, r in zip(calls_subset, rehearsals)]
-
-            if all(matches) and len(calls_subset) == len(rehearsals):
+        for start in range(len(calls)):
+            window_size = min(len(rehearsals), len(calls) - start)
+            # compare every rehearsal in every window, without short-circuiting,
+            # so matchers with side effects, like Captor, see every call
+            matches = [
+                match_event(calls[start + offset], rehearsals[offset])
+                for offset in range(window_size)
+            ]
+
+            if window_size == len(rehearsals) and all(matches):
                 match_count = match_count + 1
 
         calls_verified = match_count != 0 if times is None else match_count == times
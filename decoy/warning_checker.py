@@ -1,4 +1,5 @@
 """Warning checker."""
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
 from itertools import groupby
 from typing import Dict, List, NamedTuple, Sequence
@@ -41,19 +42,30 @@ def _check_no_miscalled_stubs(all_events: Sequence[AnySpyEvent]) -> None:
         all_events_by_id[event.spy.id].append(event)
 
     for events in all_events_by_id.values():
+        # partition the call rehearsals up front so each call only needs to
+        # slice the rehearsals before or after it, rather than re-filter events
+        when_indices: List[int] = []
+        all_when_rehearsals: List[WhenRehearsal] = []
+        verify_indices: List[int] = []
+        all_verify_rehearsals: List[VerifyRehearsal] = []
+
+        for index, event in enumerate(events):
+            if isinstance(event, WhenRehearsal) and isinstance(event.payload, SpyCall):
+                when_indices.append(index)
+                all_when_rehearsals.append(event)
+            elif isinstance(event, VerifyRehearsal) and isinstance(
+                event.payload, SpyCall
+            ):
+                verify_indices.append(index)
+                all_verify_rehearsals.append(event)
+
         for index, event in enumerate(events):
             if isinstance(event, SpyEvent) and isinstance(event.payload, SpyCall):
-                when_rehearsals = [
-                    rehearsal
-                    for rehearsal in events[0:index]
-                    if isinstance(rehearsal, WhenRehearsal)
-                    and isinstance(rehearsal.payload, SpyCall)
+                when_rehearsals = all_when_rehearsals[
+                    : bisect_left(when_indices, index)
                 ]
-                verify_rehearsals = [
-                    rehearsal
-                    for rehearsal in events[index + 1 :]
-                    if isinstance(rehearsal, VerifyRehearsal)
-                    and isinstance(rehearsal.payload, SpyCall)
+                verify_rehearsals = all_verify_rehearsals[
+                    bisect_right(verify_indices, index) :
                 ]
 
                 all_rehearsals: List[SpyRehearsal] = [
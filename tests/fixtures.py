@@ -101,6 +101,11 @@ def some_func(val: str) -> str:
     raise NotImplementedError()
 
 
+def some_func_with_defaults(val: str, count: int = 1, sep: str = "") -> str:
+    """Test function with default arguments."""
+    raise NotImplementedError()
+
+
 async def some_async_func(val: str) -> str:
     """Async test function."""
     raise NotImplementedError()
@@ -509,3 +509,22 @@ def test_reset(
         spy_log.clear(),
         stub_store.clear(),
     )
+
+
+def test_reset_without_calls(
+    decoy: Decoy,
+    spy_log: SpyLog,
+    stub_store: StubStore,
+    warning_checker: WarningChecker,
+    subject: DecoyCore,
+) -> None:
+    """It should skip the warning checks if no spies were used."""
+    decoy.when(spy_log.get_all()).then_return([])
+
+    subject.reset()
+
+    decoy.verify(warning_checker.check([]), times=0)
+    decoy.verify(
+        spy_log.clear(),
+        stub_store.clear(),
+    )
@@ -167,3 +167,4 @@ def test_verify_error(
     """It should stringify VerifyError properly."""
     error = VerifyError(rehearsals=rehearsals, calls=calls, times=times)
     assert str(error) == expected_message
+    assert error.args == (expected_message,)
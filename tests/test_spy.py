@@ -1,5 +1,6 @@
 """Tests for spies and spy creation."""
 import pytest
+import copy
 import inspect
 import sys
 
@@ -62,6 +63,20 @@ def test_create_async_spy(decoy: Decoy, call_handler: CallHandler) -> None:
     assert isinstance(result, AsyncSpy)
 
 
+def test_copy_spy(call_handler: CallHandler, spy_creator: SpyCreator) -> None:
+    """It should be able to shallow and deep copy a spy."""
+    core = SpyCore(source=SomeClass, name=None)
+    subject = Spy(core=core, call_handler=call_handler, spy_creator=spy_creator)
+
+    shallow_copy = copy.copy(subject)
+    deep_copy = copy.deepcopy(subject)
+
+    assert isinstance(shallow_copy, SomeClass)
+    assert isinstance(deep_copy, SomeClass)
+    assert repr(shallow_copy) == "<Decoy mock `tests.fixtures.SomeClass`>"
+    assert repr(deep_copy) == "<Decoy mock `tests.fixtures.SomeClass`>"
+
+
 def test_child_spy(
     decoy: Decoy,
     call_handler: CallHandler,
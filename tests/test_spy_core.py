@@ -1,5 +1,7 @@
 """Tests for SpyCore instances."""
+import abc
 import pytest
+import functools
 import inspect
 import warnings
 from typing import Any, Dict, NamedTuple, Optional, Tuple, Type
@@ -15,7 +17,9 @@ from .fixtures import (
     GenericClass,
     GenericT,
     ConcreteAlias,
+    noop,
     some_func,
+    some_func_with_defaults,
     some_async_func,
     some_wrapped_func,
 )
@@ -265,6 +269,59 @@ def test_get_signature(
     assert subject.signature == expected_signature
 
 
+def test_get_signature_reused() -> None:
+    """It should only inspect a given spec source's signature once."""
+    subject = SpyCore(source=some_func, name=None)
+    other_subject = SpyCore(source=some_func, name="other_name")
+
+    assert subject.signature is other_subject.signature
+
+
+def test_get_signature_reused_for_methods() -> None:
+    """It should only inspect a given method's signature once."""
+    parent = SpyCore(source=SomeClass, name=None)
+    subject = parent.create_child_core("foo", is_async=False)
+    other_subject = parent.create_child_core("foo", is_async=False)
+
+    assert subject.signature is other_subject.signature
+
+
+def test_get_signature_partial_without_eq() -> None:
+    """It should inspect a partial without comparing its bound arguments."""
+
+    class _Incomparable:
+        def __eq__(self, other: object) -> bool:
+            raise ValueError("cannot compare")
+
+    subject = SpyCore(source=functools.partial(some_func, _Incomparable()), name=None)
+
+    assert subject.signature == inspect.Signature(return_annotation=str)
+
+
+def test_get_signature_custom_metaclass() -> None:
+    """It should inspect children of classes with a custom metaclass."""
+
+    class _AbstractClass(abc.ABC):
+        @abc.abstractmethod
+        def foo(self, val: str) -> str:
+            ...
+
+    subject = SpyCore(source=_AbstractClass, name=None).create_child_core(
+        "foo", is_async=False
+    )
+
+    assert subject.signature == inspect.Signature(
+        parameters=[
+            inspect.Parameter(
+                name="val",
+                kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                annotation=str,
+            )
+        ],
+        return_annotation=str,
+    )
+
+
 @pytest.mark.filterwarnings("ignore:'NoneType' object is not subscriptable")
 def test_get_signature_no_type_hints() -> None:
     """It should gracefully degrade if a class's type hints cannot be resolved."""
@@ -419,6 +476,34 @@ class GetBindArgsSpec(NamedTuple):
             expected_args=("hello",),
             expected_kwargs={},
         ),
+        GetBindArgsSpec(
+            subject=SpyCore(source=some_func, name=None),
+            input_args=("hello",),
+            input_kwargs={},
+            expected_args=("hello",),
+            expected_kwargs={},
+        ),
+        GetBindArgsSpec(
+            subject=SpyCore(source=some_func_with_defaults, name=None),
+            input_args=("hello",),
+            input_kwargs={"count": 2},
+            expected_args=("hello", 2),
+            expected_kwargs={},
+        ),
+        GetBindArgsSpec(
+            subject=SpyCore(source=some_func_with_defaults, name=None),
+            input_args=(),
+            input_kwargs={"sep": ",", "val": "hello"},
+            expected_args=("hello",),
+            expected_kwargs={"sep": ","},
+        ),
+        GetBindArgsSpec(
+            subject=SpyCore(source=noop, name=None),
+            input_args=(1, 2, 3),
+            input_kwargs={},
+            expected_args=(1, 2, 3),
+            expected_kwargs={},
+        ),
     ],
 )
 def test_bind_args(
@@ -441,6 +526,14 @@ def test_warn_if_called_incorrectly() -> None:
     with pytest.warns(IncorrectCallWarning, match="missing a required argument"):
         subject.bind_args(wrong_arg_name="1")
 
+    with pytest.warns(IncorrectCallWarning, match="too many positional arguments"):
+        subject.bind_args("1", "2")
+
+    with pytest.warns(IncorrectCallWarning, match="missing a required argument"):
+        SpyCore(source=SomeClass, name=None).create_child_core(
+            "do_the_thing", is_async=False
+        ).bind_args()
+
 
 def test_warn_if_spec_does_not_have_method() -> None:
     """It should trigger a warning if bound_args is called incorrectly."""
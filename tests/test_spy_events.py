@@ -2,6 +2,7 @@
 import pytest
 from typing import List, NamedTuple
 
+from decoy import matchers
 from decoy.spy_events import (
     PropAccessType,
     SpyCall,
@@ -11,6 +12,7 @@ from decoy.spy_events import (
     SpyRehearsal,
     WhenRehearsal,
     VerifyRehearsal,
+    get_prop_access,
     match_event,
 )
 
@@ -142,6 +144,21 @@ match_event_specs: List[MatchEventSpec] = [
         ),
         expected_result=False,
     ),
+    MatchEventSpec(
+        event=SpyEvent(
+            spy=SpyInfo(id=42, name="my_spy", is_async=False),
+            payload=SpyCall(args=(), kwargs={"foo": "bar"}),
+        ),
+        rehearsal=VerifyRehearsal(
+            spy=SpyInfo(id=42, name="my_spy", is_async=False),
+            payload=SpyCall(
+                args=(),
+                kwargs={"baz": matchers.Anything()},
+                ignore_extra_args=True,
+            ),
+        ),
+        expected_result=False,
+    ),
     MatchEventSpec(
         event=SpyEvent(
             spy=SpyInfo(id=42, name="my_spy", is_async=False),
@@ -223,3 +240,51 @@ def test_match_eq_override() -> None:
     assert match_event(event_kwargs, rehearsal_kwargs) is True
     assert match_event(event_args, rehearsal_args_ignore_extra) is True
     assert match_event(event_kwargs, rehearsal_kwargs_ignore_extra) is True
+
+
+def test_match_event_ignore_extra_args_captures_leading_args() -> None:
+    """It should compare leading arguments even if the call is missing later ones."""
+    captor = matchers.Captor()
+    event = SpyEvent(
+        spy=SpyInfo(id=42, name="my_spy", is_async=False),
+        payload=SpyCall(args=(7,), kwargs={}),
+    )
+    rehearsal = VerifyRehearsal(
+        spy=SpyInfo(id=42, name="my_spy", is_async=False),
+        payload=SpyCall(args=(captor, 5), kwargs={}, ignore_extra_args=True),
+    )
+
+    assert match_event(event, rehearsal) is False
+    assert captor.values == [7]
+
+
+def test_match_event_ignore_extra_args_captures_kwargs() -> None:
+    """It should compare keyword arguments even if a positional argument differs."""
+    captor = matchers.Captor()
+    event = SpyEvent(
+        spy=SpyInfo(id=42, name="my_spy", is_async=False),
+        payload=SpyCall(args=(2,), kwargs={"key": "x"}),
+    )
+    rehearsal = VerifyRehearsal(
+        spy=SpyInfo(id=42, name="my_spy", is_async=False),
+        payload=SpyCall(args=(1,), kwargs={"key": captor}, ignore_extra_args=True),
+    )
+
+    assert match_event(event, rehearsal) is False
+    assert captor.values == ["x"]
+
+
+def test_get_prop_access() -> None:
+    """It should return interned property get and delete payloads."""
+    result = get_prop_access("__enter__", PropAccessType.GET)
+
+    assert result == SpyPropAccess(
+        prop_name="__enter__",
+        access_type=PropAccessType.GET,
+    )
+    assert get_prop_access("__enter__", PropAccessType.GET) is result
+    assert get_prop_access("__exit__", PropAccessType.GET) is not result
+    assert get_prop_access("__enter__", PropAccessType.DELETE) == SpyPropAccess(
+        prop_name="__enter__",
+        access_type=PropAccessType.DELETE,
+    )
@@ -51,6 +51,32 @@ def test_get_by_call_prefers_latest() -> None:
     assert result == behavior_2
 
 
+def test_get_by_call_other_spy() -> None:
+    """It should only return stubs that belong to the called spy."""
+    subject = StubStore()
+    rehearsal_1 = WhenRehearsal(
+        spy=SpyInfo(id=42, name="my_spy", is_async=False),
+        payload=SpyCall(args=(), kwargs={}),
+    )
+    behavior_1 = StubBehavior(return_value="hello")
+    rehearsal_2 = WhenRehearsal(
+        spy=SpyInfo(id=101, name="other_spy", is_async=False),
+        payload=SpyCall(args=(), kwargs={}),
+    )
+    behavior_2 = StubBehavior(return_value="goodbye")
+
+    subject.add(rehearsal=rehearsal_1, behavior=behavior_1)
+    subject.add(rehearsal=rehearsal_2, behavior=behavior_2)
+    result = subject.get_by_call(
+        call=SpyEvent(
+            spy=SpyInfo(id=42, name="my_spy", is_async=False),
+            payload=SpyCall(args=(), kwargs={}),
+        )
+    )
+
+    assert result == behavior_1
+
+
 def test_get_by_call_empty() -> None:
     """It should return None if store is empty."""
     subject = StubStore()
@@ -2,6 +2,7 @@
 import pytest
 from typing import List, NamedTuple, Optional
 
+from decoy import matchers
 from decoy.spy_events import SpyCall, SpyEvent, SpyInfo, VerifyRehearsal
 from decoy.errors import VerifyError
 from decoy.verifier import Verifier
@@ -295,3 +296,52 @@ def test_verify_passes(
     """It should no-op if the calls match the rehearsals."""
     subject = Verifier()
     subject.verify(rehearsals=rehearsals, calls=calls, times=times)
+
+
+def test_verify_captures_every_call() -> None:
+    """It should compare every call with the rehearsals, so captors see them all."""
+    subject = Verifier()
+    captor = matchers.Captor()
+    calls = [
+        SpyEvent(
+            spy=SpyInfo(id=42, name="my_spy", is_async=False),
+            payload=SpyCall(args=(value,), kwargs={}),
+        )
+        for value in (1, 2, 3)
+    ]
+    rehearsal = VerifyRehearsal(
+        spy=SpyInfo(id=42, name="my_spy", is_async=False),
+        payload=SpyCall(args=(captor,), kwargs={}),
+    )
+
+    subject.verify(rehearsals=[rehearsal], calls=calls)
+
+    assert captor.values == [1, 2, 3]
+    assert captor.value == 3
+
+
+def test_verify_sequence_captures_every_call() -> None:
+    """It should compare later rehearsals even if an earlier one did not match."""
+    subject = Verifier()
+    captor = matchers.Captor()
+    calls = [
+        SpyEvent(
+            spy=SpyInfo(id=42, name="my_spy", is_async=False),
+            payload=SpyCall(args=(value,), kwargs={}),
+        )
+        for value in (1, 2, 3)
+    ]
+    rehearsals = [
+        VerifyRehearsal(
+            spy=SpyInfo(id=42, name="my_spy", is_async=False),
+            payload=SpyCall(args=(1,), kwargs={}),
+        ),
+        VerifyRehearsal(
+            spy=SpyInfo(id=42, name="my_spy", is_async=False),
+            payload=SpyCall(args=(captor,), kwargs={}),
+        ),
+    ]
+
+    subject.verify(rehearsals=rehearsals, calls=calls)
+
+    assert captor.values == [2, 3]